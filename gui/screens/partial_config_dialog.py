@@ -7,32 +7,238 @@ Allows users to configure partial LTA processing
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
-import glob
+import re
+import bisect
+import json
 import logging
-from openpyxl import load_workbook
+import tempfile
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import defaultdict, namedtuple
+from functools import cached_property
+from itertools import accumulate, islice
 from gui.utils.file_utils import get_lta_partial_info, save_lta_partial_config
 
 logger = logging.getLogger(__name__)
 
+# Labels used in the Summary sheet for the total gross weight
+_BRUT_LABELS = frozenset({'P,BRUT', 'P.BRUT'})
+
+# Last Summary row read: P,BRUT row of the 9th DUM block (C67 + 4)
+_SUMMARY_LAST_ROW = 11 + 8 * 7 + 4
+
+# Tolerance (kg) when comparing partial boundaries with DUM boundaries, so float
+# rounding never produces zero-weight slivers of a DUM
+_WEIGHT_EPSILON = 1e-6
+
+# Weight input accepted as a number ("12", "12.5", "12.", ".5")
+_NUMERIC_RE = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)$')
+
+# Delay (ms) after the last weight keystroke before the DUM preview is recomputed
+_PREVIEW_DELAY_MS = 80
+
+# Portion of a DUM assigned to a partial (the whole DUM unless is_split)
+DumSlice = namedtuple('DumSlice', 'dum_number weight positions is_split split_id')
+
+# DUM preview lines: a DUM taken whole, and the portion of a DUM split across partials
+_DUM_LINE_TEMPLATE = "DUM {number}: {weight:.1f}kg, {positions}p"
+_SPLIT_DUM_LINE_TEMPLATE = "DUM {number} {split_id}: {weight:.1f}kg, {positions}p ⚠️ PARTIEL"
+
+# Interval (ms) at which the dialog checks whether the background LTA load is done
+_LOAD_POLL_MS = 50
+
+# Sidecar file caching the parsed Summary data, in the generated_excel folder.
+# Its name must not start with "generated_excel": the scripts glob that prefix.
+_SUMMARY_CACHE_NAME = '.lta_summary_cache.json'
+
+# Bump when the Summary parsing changes so older cached results are ignored
+_SUMMARY_CACHE_VERSION = 2
+
+# XML namespaces used inside .xlsx files
+_XLSX_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_XLSX_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Splits a cell reference such as "B12" into column letters and row number
+_CELL_REF_RE = re.compile(r'^([A-Z]+)(\d+)$')
+
+
+def _num(value, cast=float):
+    """Convert a Summary cell value to a number (empty cells count as 0)"""
+    if value is None or value == '':
+        return cast(0)
+    return value if type(value) is cast else cast(value)
+
+
+def _find_generated_excel(lta_subfolder):
+    """Return the first generated_excel*.xlsx file of the LTA subfolder, or None"""
+    try:
+        with os.scandir(lta_subfolder) as entries:
+            for entry in entries:
+                # Case-insensitive like glob on Windows
+                name = entry.name.lower()
+                if name.startswith('generated_excel') and name.endswith('.xlsx') and entry.is_file():
+                    return entry.path
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _xlsx_sheet_paths(zf):
+    """Map each sheet name of an opened .xlsx to its worksheet XML path in the archive"""
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    
+    targets = {}
+    for rel in rels.iter(f'{_XLSX_PKG_REL_NS}Relationship'):
+        target = rel.get('Target', '')
+        # Targets are relative to xl/ unless absolute inside the package
+        targets[rel.get('Id')] = target.lstrip('/') if target.startswith('/') else f"xl/{target}"
+    
+    return {
+        sheet.get('name'): targets.get(sheet.get(_XLSX_REL_ID))
+        for sheet in workbook.iter(f'{_XLSX_MAIN_NS}sheet')
+    }
+
+
+def _xlsx_shared_strings(zf):
+    """Return the shared strings table of an opened .xlsx"""
+    try:
+        root = ET.fromstring(zf.read('xl/sharedStrings.xml'))
+    except KeyError:
+        return []
+    # Rich text strings are split in several <t> runs
+    return [''.join(t.text or '' for t in si.iter(f'{_XLSX_MAIN_NS}t'))
+            for si in root.iter(f'{_XLSX_MAIN_NS}si')]
+
+
+def _xlsx_cell_value(cell):
+    """Convert a <c> element to a Python value like openpyxl does with data_only=True"""
+    cell_type = cell.get('t', 'n')
+    if cell_type == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(f'{_XLSX_MAIN_NS}t'))
+    
+    # Formula cells saved by openpyxl have an empty <v/> (no cached result)
+    value = cell.findtext(f'{_XLSX_MAIN_NS}v')
+    if not value:
+        return None
+    if cell_type == 'n':
+        return float(value) if any(c in value for c in '.eE') else int(value)
+    if cell_type == 'b':
+        return value == '1'
+    return value  # 's' (resolved by the caller), 'str' and 'e'
+
+
+def _read_sheet_rows(zf, sheet_path, max_row, max_col):
+    """
+    Read the values of rows 1..max_row, columns 1..max_col of a worksheet
+    
+    Only the worksheet XML is parsed (streamed, stops after max_row) and the
+    shared strings table is loaded only if one of those cells uses it.
+    
+    Returns:
+        List of max_row tuples of max_col values (None for empty cells)
+    """
+    rows = [[None] * max_col for _ in range(max_row)]
+    shared_cells = []  # (row, col) of cells holding a shared string index
+    
+    row_num = 0
+    with zf.open(sheet_path) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag != f'{_XLSX_MAIN_NS}row':
+                continue
+            row_num = int(elem.get('r', row_num + 1))
+            if row_num > max_row:
+                break
+            
+            col_num = 0
+            for cell in elem.iter(f'{_XLSX_MAIN_NS}c'):
+                match = _CELL_REF_RE.match(cell.get('r', ''))
+                if match:
+                    col_num = 0
+                    for letter in match.group(1):
+                        col_num = col_num * 26 + ord(letter) - ord('A') + 1
+                else:
+                    col_num += 1
+                if col_num > max_col:
+                    continue
+                
+                rows[row_num - 1][col_num - 1] = _xlsx_cell_value(cell)
+                if cell.get('t') == 's' and rows[row_num - 1][col_num - 1] is not None:
+                    shared_cells.append((row_num - 1, col_num - 1))
+            elem.clear()
+    
+    if shared_cells:
+        shared_strings = _xlsx_shared_strings(zf)
+        for r, c in shared_cells:
+            rows[r][c] = shared_strings[int(rows[r][c])]
+    
+    return [tuple(row) for row in rows]
+
+
+def _summary_cache_path(excel_path):
+    """Path of the sidecar cache for an Excel file"""
+    return os.path.join(os.path.dirname(excel_path), _SUMMARY_CACHE_NAME)
+
+
+def _read_summary_cache(excel_path, excel_stat):
+    """Return cached LTA data if the sidecar matches the Excel file, else None"""
+    try:
+        with open(_summary_cache_path(excel_path), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (not isinstance(cache, dict)
+            or cache.get('version') != _SUMMARY_CACHE_VERSION
+            or cache.get('source') != os.path.basename(excel_path)
+            or cache.get('mtime_ns') != excel_stat.st_mtime_ns
+            or cache.get('size') != excel_stat.st_size):
+        return None
+    return cache.get('data')
+
+
+def _write_summary_cache(excel_path, excel_stat, data):
+    """Atomically write the sidecar cache (failures are logged, not raised)"""
+    cache_path = _summary_cache_path(excel_path)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': _SUMMARY_CACHE_VERSION,
+                'source': os.path.basename(excel_path),
+                'mtime_ns': excel_stat.st_mtime_ns,
+                'size': excel_stat.st_size,
+                'data': data
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write LTA summary cache {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
 class PartialConfigDialog:
     """Dialog for configuring partial LTA processing"""
     
-    def __init__(self, parent, lta_folder_path, folder_name):
+    def __init__(self, parent, lta_folder_path, folder_name, lta_file_path=None):
         self.parent = parent
         self.lta_folder_path = lta_folder_path
         self.folder_name = folder_name
+        self.lta_file_path = lta_file_path  # LTA .txt file, looked up by folder name if not given
         self.config_saved = False
+        self._preview_after_id = None  # Pending debounced preview update
+        self._last_preview_weights = None  # Partial weights the preview currently shows
+        self.partial_forms = []  # Forms currently shown, the first ones of _form_pool
+        self._form_pool = []
         
         # Load existing config if available
         self.existing_config = get_lta_partial_info(lta_folder_path, folder_name)
-        
-        # Load LTA data from generated_excel
-        self.lta_data = self._load_lta_data()
-        
-        if not self.lta_data:
-            messagebox.showerror("Erreur", "Impossible de charger les données LTA.\nVeuillez exécuter le script de préparation d'abord.")
-            return
+        self._existing_by_num = {
+            p['partial_number']: p for p in self.existing_config['partials']
+        } if self.existing_config else {}
         
         # Create dialog
         self.dialog = tk.Toplevel(parent)
@@ -41,38 +247,111 @@ class PartialConfigDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
+        # Load LTA data from generated_excel in the background, the dialog shows
+        # a placeholder until it is ready (Tk is only touched from this thread)
+        self.lta_data = None
+        self._load_result = None  # (lta_data, error) set by the loading thread
+        self._loading_label = ttk.Label(self.dialog, text="Chargement des données LTA…", font=('Arial', 10, 'italic'))
+        self._loading_label.pack(expand=True)
+        threading.Thread(target=self._load_in_background, daemon=True).start()
+        self.dialog.after(_LOAD_POLL_MS, self._poll_lta_data)
+    
+    def _load_in_background(self):
+        """Worker thread: parse the LTA data without touching any widget"""
+        self._load_result = self._load_lta_data()
+    
+    def _poll_lta_data(self):
+        """Build the dialog UI once the background load has finished"""
+        if not self.dialog.winfo_exists():
+            return
+        if self._load_result is None:
+            self.dialog.after(_LOAD_POLL_MS, self._poll_lta_data)
+            return
+        
+        self.lta_data, error = self._load_result
+        if error:
+            show_message, title, message = error
+            show_message(title, message, parent=self.dialog)
+        
+        if not self.lta_data:
+            messagebox.showerror(
+                "Erreur",
+                "Impossible de charger les données LTA.\nVeuillez exécuter le script de préparation d'abord.",
+                parent=self.dialog
+            )
+            self.dialog.destroy()
+            return
+        
+        self._prepare_dum_data()
+        self._loading_label.destroy()
         self._setup_ui()
     
+    def _prepare_dum_data(self):
+        """Derive the DUM lookup structures used by the preview and the distribution"""
+        # Cumulative DUM weights: DUM i covers [cum[i], cum[i + 1]] of the LTA weight
+        dums = self.lta_data['dums']
+        self._dum_cum_weights = list(accumulate((dum['weight'] for dum in dums), initial=0.0))
+        
+        # Parallel tuples of the DUM fields, read by the distribution loop
+        self._dum_numbers = tuple(dum['number'] for dum in dums)
+        self._dum_weights = tuple(dum['weight'] for dum in dums)
+        self._dum_positions = tuple(dum['positions'] for dum in dums)
+        self._min_dum_weight = min(self._dum_weights) if self._dum_weights else 0.0
+        
+        # Preview line of each DUM taken whole, the same for every partial form
+        self._dum_preview_lines = {
+            dum['number']: _DUM_LINE_TEMPLATE.format(**dum)
+            for dum in dums
+        }
+    
     def _load_lta_data(self):
-        """Load LTA data from generated_excel file"""
+        """
+        Load LTA data from generated_excel file
+        
+        Runs on the loading thread, so errors are returned instead of shown.
+        
+        Returns:
+            Tuple (lta_data, error): lta_data is None on failure, error is None or
+            (messagebox function, title, message) to show on the Tk thread
+        """
         try:
             lta_subfolder = os.path.join(self.lta_folder_path, self.folder_name)
-            excel_files = glob.glob(os.path.join(lta_subfolder, "generated_excel*.xlsx"))
+            excel_path = _find_generated_excel(lta_subfolder)
             
-            if not excel_files:
+            if not excel_path:
                 logger.error(f"No generated_excel file found in {lta_subfolder}")
-                messagebox.showwarning(
+                return None, (
+                    messagebox.showwarning,
                     "Fichier introuvable",
                     f"Le fichier 'generated_excel' n'a pas été trouvé dans:\n{lta_subfolder}\n\n"
                     "Veuillez exécuter la détection LTA d'abord."
                 )
-                return None
-            
-            logger.info(f"Loading LTA data from: {excel_files[0]}")
-            wb = load_workbook(excel_files[0], data_only=True)
-            
-            # Check if Summary sheet exists
-            if 'Summary' not in wb.sheetnames:
-                logger.error(f"Summary sheet not found. Available sheets: {wb.sheetnames}")
-                wb.close()
-                messagebox.showerror(
-                    "Erreur",
-                    f"La feuille 'Summary' n'existe pas dans le fichier Excel.\n\n"
-                    f"Feuilles disponibles: {', '.join(wb.sheetnames)}"
-                )
-                return None
             
-            ws = wb['Summary']
+            # Reuse the parsed data while the Excel file is unchanged
+            excel_stat = os.stat(excel_path)
+            cached_data = _read_summary_cache(excel_path, excel_stat)
+            if cached_data is not None:
+                logger.info(f"Loaded LTA data from cache: {_summary_cache_path(excel_path)}")
+                return cached_data, None
+            
+            # Read the Summary worksheet straight from the .xlsx archive: only a few
+            # dozen cells are needed, openpyxl would build the whole workbook model
+            logger.info(f"Loading LTA data from: {excel_path}")
+            with zipfile.ZipFile(excel_path) as zf:
+                sheet_paths = _xlsx_sheet_paths(zf)
+                
+                # Check if Summary sheet exists
+                if not sheet_paths.get('Summary'):
+                    logger.error(f"Summary sheet not found. Available sheets: {list(sheet_paths)}")
+                    return None, (
+                        messagebox.showerror,
+                        "Erreur",
+                        f"La feuille 'Summary' n'existe pas dans le fichier Excel.\n\n"
+                        f"Feuilles disponibles: {', '.join(sheet_paths)}"
+                    )
+                
+                # Columns A-C of all the rows we need, in a single streaming pass
+                rows = _read_sheet_rows(zf, sheet_paths['Summary'], _SUMMARY_LAST_ROW, 3)
             
             # Get total weight and positions from Summary sheet
             # Data is in column A (labels) and column B (values)
@@ -81,16 +360,14 @@ class PartialConfigDialog:
             
             # Search for "P,BRUT" and "P" labels in column A (rows 1-10)
             for row in range(1, 15):
-                cell_a = ws[f'A{row}'].value
+                cell_a, val, _ = rows[row - 1]
                 if cell_a:
                     cell_a_str = str(cell_a).strip().upper()
-                    if 'P,BRUT' in cell_a_str or 'P.BRUT' in cell_a_str:
-                        val = ws[f'B{row}'].value
+                    if cell_a_str in _BRUT_LABELS:
                         if val and isinstance(val, (int, float)):
                             total_weight = val
                             logger.info(f"Found total weight at B{row}: {total_weight}")
                     elif cell_a_str == 'P' and not total_positions:  # P for positions (before P,BRUT in file)
-                        val = ws[f'B{row}'].value
                         if val and isinstance(val, (int, float)):
                             total_positions = val
                             logger.info(f"Found total positions at B{row}: {total_positions}")
@@ -107,45 +384,46 @@ class PartialConfigDialog:
             dums = []
             for dum_idx in range(1, 10):
                 row_num = 11 + (dum_idx - 1) * 7
-                cell_value = ws[f'C{row_num}'].value
+                cell_value = rows[row_num - 1][2]
                 
-                if cell_value and 'DUM' in str(cell_value).upper():
+                if isinstance(cell_value, str) and cell_value.lstrip()[:3].upper() == 'DUM':
                     # Get DUM positions and weight from column A (labels) and B (values)
                     # P is at row_num + 1, P,BRUT is at row_num + 4
                     dum_positions_row = row_num + 1  # P is 1 row below DUM label
                     dum_weight_row = row_num + 4     # P,BRUT is 4 rows below DUM label
                     
-                    dum_positions = ws[f'B{dum_positions_row}'].value or 0
-                    dum_weight = ws[f'B{dum_weight_row}'].value or 0
+                    dum_positions = rows[dum_positions_row - 1][1]
+                    dum_weight = rows[dum_weight_row - 1][1]
                     
                     logger.info(f"DUM {dum_idx} (row {row_num}): weight={dum_weight}, positions={dum_positions}")
                     
                     dums.append({
                         'number': dum_idx,
-                        'weight': float(dum_weight) if dum_weight else 0,
-                        'positions': int(dum_positions) if dum_positions else 0
+                        'weight': _num(dum_weight),
+                        'positions': _num(dum_positions, int)
                     })
                 else:
                     break
             
-            wb.close()
-            
             logger.info(f"Loaded {len(dums)} DUMs")
             
-            return {
-                'total_weight': float(total_weight) if total_weight else 0,
-                'total_positions': int(total_positions) if total_positions else 0,
+            lta_data = {
+                'total_weight': _num(total_weight),
+                'total_positions': _num(total_positions, int),
                 'dums': dums
             }
+            _write_summary_cache(excel_path, excel_stat, lta_data)
+            
+            return lta_data, None
             
         except Exception as e:
             logger.error(f"Error loading LTA data: {e}", exc_info=True)
-            messagebox.showerror(
+            return None, (
+                messagebox.showerror,
                 "Erreur",
                 f"Erreur lors du chargement des données LTA:\n{str(e)}\n\n"
                 f"Vérifiez le fichier Excel 'generated_excel' dans:\n{lta_subfolder}"
             )
-            return None
     
     def _setup_ui(self):
         """Setup the dialog UI"""
@@ -232,11 +510,8 @@ class PartialConfigDialog:
         canvas = tk.Canvas(self.partials_container, highlightthickness=0)
         scrollbar = ttk.Scrollbar(self.partials_container, orient=tk.VERTICAL, command=canvas.yview)
         self.scrollable_frame = ttk.Frame(canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._on_forms_configure)
+        self.scrollable_frame.grid_columnconfigure(0, weight=1)
         
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor=tk.NW)
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -246,6 +521,11 @@ class PartialConfigDialog:
         
         self.canvas = canvas
         
+        # Bind mousewheel
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", self._on_mousewheel)
+        self.canvas.bind("<Button-5>", self._on_mousewheel)
+        
         # Buttons
         buttons_frame = ttk.Frame(main_frame)
         buttons_frame.pack(fill=tk.X, pady=10)
@@ -273,40 +553,54 @@ class PartialConfigDialog:
     
     def _generate_partial_forms(self, load_existing=False):
         """Generate forms for each partial"""
-        # Clear existing forms
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        self.partial_forms = []
         num_partials = self.num_partials_var.get()
         
+        # Forms are pooled: existing ones are reset and shown again, only missing
+        # ones are built and extra ones are hidden (widgets are never destroyed).
+        # The <Configure> binding is suspended while the layout changes.
+        self.scrollable_frame.unbind("<Configure>")
+        
+        for form_data in self._form_pool[num_partials:]:
+            form_data['frame'].grid_remove()
+        
         for i in range(num_partials):
             partial_num = i + 1
             
             # Load existing data if available
-            existing_data = None
-            if load_existing and self.existing_config:
-                for p in self.existing_config['partials']:
-                    if p['partial_number'] == partial_num:
-                        existing_data = p
-                        break
-            
-            frame = self._create_partial_form(partial_num, existing_data)
-            frame.pack(fill=tk.X, pady=5, padx=10)
+            existing_data = self._existing_by_num.get(partial_num) if load_existing else None
             
-        # Bind mousewheel
-        def on_mousewheel(event):
-            if event.num == 5 or event.delta < 0:
-                self.canvas.yview_scroll(1, "units")
-            elif event.num == 4 or event.delta > 0:
-                self.canvas.yview_scroll(-1, "units")
+            if i < len(self._form_pool):
+                form_data = self._form_pool[i]
+                self._fill_partial_form(form_data, existing_data)
+            else:
+                form_data = self._create_partial_form(partial_num, existing_data)
+            form_data['frame'].grid(row=i, column=0, sticky=(tk.W, tk.E), pady=5, padx=10)
+        
+        self.partial_forms = self._form_pool[:num_partials]
+        self._last_preview_weights = None  # Forms were reset, the preview must be redone
         
-        self.canvas.bind("<MouseWheel>", on_mousewheel)
-        self.canvas.bind("<Button-4>", on_mousewheel)
-        self.canvas.bind("<Button-5>", on_mousewheel)
+        # Compute the scroll region once for the whole build, then follow later resizes
+        self.scrollable_frame.update_idletasks()
+        self._on_forms_configure(None)
+        self.scrollable_frame.bind("<Configure>", self._on_forms_configure)
+    
+    def _on_forms_configure(self, event):
+        """Keep the canvas scroll region in sync with the partial forms size"""
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _on_mousewheel(self, event):
+        """Scroll the partial forms (Button-4/5 on X11, MouseWheel delta elsewhere)"""
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            # Windows reports multiples of 120 per notch, macOS small deltas
+            units = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self.canvas.yview_scroll(units, "units")
     
     def _create_partial_form(self, partial_num, existing_data=None):
-        """Create form for a single partial"""
+        """Create form for a single partial and add it to the form pool"""
         frame = ttk.LabelFrame(
             self.scrollable_frame,
             text=f"Partiel {partial_num}",
@@ -343,31 +637,51 @@ class PartialConfigDialog:
         location_entry = ttk.Entry(frame, textvariable=location_var, width=30)
         location_entry.grid(row=3, column=1, columnspan=3, sticky=tk.W, padx=5, pady=2)
         
-        # DUM Distribution Preview (read-only text widget)
+        # DUM Distribution Preview (read-only, at most one line per DUM)
         ttk.Label(frame, text="Distribution DUMs (auto):").grid(row=4, column=0, sticky=tk.NW, padx=5, pady=2)
         
-        dums_text = tk.Text(frame, height=6, width=50, state='disabled', wrap=tk.WORD)
-        dums_text.grid(row=4, column=1, columnspan=3, sticky=(tk.W, tk.E), padx=5, pady=2)
-        
-        # Scrollbar for DUM distribution
-        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=dums_text.yview)
-        scrollbar.grid(row=4, column=4, sticky=(tk.N, tk.S))
-        dums_text.configure(yscrollcommand=scrollbar.set)
+        dums_var = tk.StringVar(value="")
+        dums_label = ttk.Label(frame, textvariable=dums_var, justify=tk.LEFT, anchor=tk.NW, wraplength=400)
+        dums_label.grid(row=4, column=1, columnspan=3, sticky=(tk.W, tk.E), padx=5, pady=2)
         
-        self.partial_forms.append({
+        form_data = {
             'partial_number': partial_num,
+            'frame': frame,
             'weight_var': weight_var,
             'positions_var': positions_var,
             'ds_serie_var': ds_serie_var,
             'ds_cle_var': ds_cle_var,
             'location_var': location_var,
-            'dums_text': dums_text
-        })
+            'dums_var': dums_var,
+            'dums_text_content': ''  # Text currently shown in dums_var
+        }
+        self._form_pool.append(form_data)
         
         # Trace weight changes to auto-calculate and update display
-        weight_var.trace('w', lambda *args: self._update_distribution_preview())
+        weight_var.trace_add('write', lambda *args: self._schedule_preview_update())
         
-        return frame
+        return form_data
+    
+    def _fill_partial_form(self, form_data, existing_data=None):
+        """Reset an existing partial form, optionally with saved values"""
+        form_data['weight_var'].set(existing_data['weight'] if existing_data else "")
+        form_data['positions_var'].set("")
+        form_data['ds_serie_var'].set(existing_data['ds_serie'] if existing_data else "")
+        form_data['ds_cle_var'].set(existing_data['ds_cle'] if existing_data else "")
+        form_data['location_var'].set(existing_data['loading_location'] if existing_data else "")
+        self._set_dums_text(form_data, "")
+    
+    def _schedule_preview_update(self):
+        """Debounce weight edits so a burst of keystrokes triggers a single preview update"""
+        if self._preview_after_id is not None:
+            self.dialog.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.dialog.after(_PREVIEW_DELAY_MS, self._run_scheduled_preview)
+    
+    def _run_scheduled_preview(self):
+        """Run the pending preview update unless the dialog was closed meanwhile"""
+        self._preview_after_id = None
+        if self.dialog.winfo_exists():
+            self._update_distribution_preview()
     
     def _update_distribution_preview(self):
         """Update the DUM distribution preview for all partials"""
@@ -377,27 +691,24 @@ class PartialConfigDialog:
                 # Show error message in preview
                 for form_data in self.partial_forms:
                     form_data['positions_var'].set("0")
-                    dums_text = form_data['dums_text']
-                    dums_text.configure(state='normal')
-                    dums_text.delete('1.0', tk.END)
-                    dums_text.insert(tk.END, "⚠️ Données LTA invalides\n(Poids = 0 ou aucun DUM)")
-                    dums_text.configure(state='disabled')
+                    self._set_dums_text(form_data, "⚠️ Données LTA invalides\n(Poids = 0 ou aucun DUM)")
                 return
             
             # Collect partial weights
+            # (empty or half-typed input is common here, test it instead of catching ValueError)
             partial_weights = []
             for form_data in self.partial_forms:
-                try:
-                    weight = float(form_data['weight_var'].get().strip())
-                    partial_weights.append(weight)
-                except ValueError:
-                    partial_weights.append(0)
+                weight_str = form_data['weight_var'].get().strip()
+                partial_weights.append(float(weight_str) if _NUMERIC_RE.match(weight_str) else 0)
             
-            # Detect exception case: check if any partial weight < smallest DUM weight
-            smallest_dum_weight = min(dum['weight'] for dum in self.lta_data['dums'])
-            is_exception_case = any(w > 0 and w < smallest_dum_weight for w in partial_weights)
+            # Nothing to redo if the weights are the ones already shown
+            weights_key = tuple(partial_weights)
+            if weights_key == self._last_preview_weights:
+                return
+            self._last_preview_weights = weights_key
             
-            if is_exception_case:
+            # Detect exception case: check if any partial weight < smallest DUM weight
+            if self._find_exception_partial(partial_weights) is not None:
                 # Show exception frame if hidden
                 if not self.exception_frame.winfo_manager():
                     self.exception_frame.pack(fill=tk.X, pady=5, before=self.partials_container)
@@ -407,7 +718,7 @@ class PartialConfigDialog:
                     self.exception_frame.pack_forget()
             
             # Calculate distribution
-            distribution = self._calculate_dum_distribution(partial_weights)
+            distribution, _ = self._calculate_dum_distribution(partial_weights)
             
             # Update each partial's display
             for idx, form_data in enumerate(self.partial_forms):
@@ -417,112 +728,150 @@ class PartialConfigDialog:
                     # Update positions
                     form_data['positions_var'].set(str(partial_dist['positions']))
                     
-                    # Update DUM list
-                    dums_text = form_data['dums_text']
-                    dums_text.configure(state='normal')
-                    dums_text.delete('1.0', tk.END)
-                    
+                    # Update DUM list (built in full first, written in one go)
                     if not partial_dist['dums']:
-                        dums_text.insert(tk.END, "Aucun DUM assigné")
+                        lines = ["Aucun DUM assigné"]
                     else:
+                        lines = []
                         for dum_info in partial_dist['dums']:
-                            dum_num = dum_info['dum_number']
-                            dum_weight = dum_info['weight']
-                            dum_positions = dum_info['positions']
-                            is_split = dum_info['is_split']
-                            split_id = dum_info.get('split_id', '')
-                            
-                            if is_split:
-                                dums_text.insert(tk.END, f"DUM {dum_num} {split_id}: {dum_weight:.1f}kg, {dum_positions}p ⚠️ PARTIEL\n")
+                            if dum_info.is_split:
+                                lines.append(_SPLIT_DUM_LINE_TEMPLATE.format(
+                                    number=dum_info.dum_number,
+                                    split_id=dum_info.split_id,
+                                    weight=dum_info.weight,
+                                    positions=dum_info.positions
+                                ))
                             else:
-                                dums_text.insert(tk.END, f"DUM {dum_num}: {dum_weight:.1f}kg, {dum_positions}p\n")
+                                lines.append(self._dum_preview_lines[dum_info.dum_number])
                     
-                    dums_text.configure(state='disabled')
+                    self._set_dums_text(form_data, "\n".join(lines))
         except Exception as e:
             # Silently handle preview errors to avoid disrupting user input
             logger.error(f"Error updating distribution preview: {e}", exc_info=True)
     
+    def _set_dums_text(self, form_data, text):
+        """Replace a partial's DUM preview text, skipping the Tk update if unchanged"""
+        if form_data['dums_text_content'] == text:
+            return
+        
+        form_data['dums_var'].set(text)
+        form_data['dums_text_content'] = text
+    
+    def _find_exception_partial(self, partial_weights):
+        """
+        Detect the exception case: a partial lighter than the smallest DUM
+        
+        Args:
+            partial_weights: Weight of each partial (0 for a weight not entered yet)
+            
+        Returns:
+            Index of the lightest such partial, or None if there is none
+        """
+        exception_idx = None
+        for idx, weight in enumerate(partial_weights):
+            if 0 < weight < self._min_dum_weight and (
+                    exception_idx is None or weight < partial_weights[exception_idx]):
+                exception_idx = idx
+        return exception_idx
+    
     def _calculate_dum_distribution(self, partial_weights):
         """
         Automatically distribute DUMs across partials based on weights.
         Sequential distribution: Fill partials in order until weight is reached.
         Last DUM may be split if needed.
+        
+        Returns:
+            Tuple (distribution, split_dums): one dict per partial (its 'dums' are
+            DumSlice tuples), and the split DUMs keyed by DUM number (str) with
+            their total weight and splits
         """
         distribution = []
+        split_dums = defaultdict(lambda: {'total_weight': 0, 'splits': []})
         
         total_lta_weight = self.lta_data['total_weight']
         total_lta_positions = self.lta_data['total_positions']
-        dums = self.lta_data['dums']
+        dum_numbers = self._dum_numbers
+        dum_weights = self._dum_weights
+        dum_positions = self._dum_positions
         
         # Validate LTA data
-        if not dums or total_lta_weight <= 0 or total_lta_positions <= 0:
+        if not dum_numbers or total_lta_weight <= 0 or total_lta_positions <= 0:
             # Return empty distribution if LTA data is invalid
             for _ in partial_weights:
                 distribution.append({'weight': 0, 'positions': 0, 'dums': []})
-            return distribution
+            return distribution, {}
+        
+        cum_weights = self._dum_cum_weights
+        total_dum_weight = cum_weights[-1]
+        target_positions = self._proportional_positions(partial_weights)
         
-        current_dum_idx = 0
-        remaining_dum_weight = dums[0]['weight'] if dums else 0
-        remaining_dum_positions = dums[0]['positions'] if dums else 0
-        is_continuing_split = False  # Track if we're continuing a split DUM
+        partial_start = 0.0  # Cumulative weight where the current partial starts
+        split_dum_positions = 0  # Positions left in a DUM split by the previous partial
         
         for partial_idx, partial_weight in enumerate(partial_weights):
             if partial_weight <= 0:
                 distribution.append({'weight': 0, 'positions': 0, 'dums': []})
                 continue
             
-            # Calculate positions for this partial (safe division)
-            if total_lta_weight > 0:
-                partial_positions = round((partial_weight * total_lta_positions) / total_lta_weight)
-            else:
-                partial_positions = 0
+            partial_positions = target_positions[partial_idx]
             
             partial_dums = []
             weight_accumulated = 0
             positions_accumulated = 0
+            partial_end = partial_start + partial_weight
             
-            # Fill DUMs until we reach the target weight
-            while weight_accumulated < partial_weight and current_dum_idx < len(dums):
-                weight_needed = partial_weight - weight_accumulated
+            if partial_start < total_dum_weight - _WEIGHT_EPSILON:
+                # Jump straight to the DUM holding the start of this partial and the
+                # DUM holding its end, everything in between is taken whole
+                first_dum_idx = bisect.bisect_left(cum_weights, partial_start - _WEIGHT_EPSILON)
+                if cum_weights[first_dum_idx] > partial_start + _WEIGHT_EPSILON:
+                    first_dum_idx -= 1
+                last_dum_idx = min(bisect.bisect_left(cum_weights, partial_end - _WEIGHT_EPSILON), len(dum_numbers)) - 1
                 
-                if remaining_dum_weight <= weight_needed:
-                    # Take entire remaining DUM (or remaining part of split DUM)
-                    partial_dums.append({
-                        'dum_number': dums[current_dum_idx]['number'],
-                        'weight': remaining_dum_weight,
-                        'positions': remaining_dum_positions,
-                        'is_split': is_continuing_split,
-                        'split_id': f"{dums[current_dum_idx]['number']}/{partial_idx + 1}" if is_continuing_split else ''
-                    })
-                    weight_accumulated += remaining_dum_weight
-                    positions_accumulated += remaining_dum_positions
-                    
-                    # Move to next DUM
-                    current_dum_idx += 1
-                    is_continuing_split = False
-                    if current_dum_idx < len(dums):
-                        remaining_dum_weight = dums[current_dum_idx]['weight']
-                        remaining_dum_positions = dums[current_dum_idx]['positions']
-                else:
-                    # Split the DUM - this is the last DUM for this partial
-                    # Calculate positions to reach the target partial_positions
-                    positions_needed = partial_positions - positions_accumulated
-                    
-                    partial_dums.append({
-                        'dum_number': dums[current_dum_idx]['number'],
-                        'weight': weight_needed,
-                        'positions': positions_needed,
-                        'is_split': True,
-                        'split_id': f"{dums[current_dum_idx]['number']}/{partial_idx + 1}"
-                    })
-                    weight_accumulated += weight_needed
-                    positions_accumulated += positions_needed
+                for dum_idx in range(first_dum_idx, last_dum_idx + 1):
+                    dum_number = dum_numbers[dum_idx]
+                    # Continuing a DUM split by the previous partial
+                    is_continuing_split = (
+                        dum_idx == first_dum_idx
+                        and partial_start > cum_weights[dum_idx] + _WEIGHT_EPSILON
+                    )
                     
-                    # Update remaining DUM
-                    remaining_dum_weight -= weight_needed
-                    remaining_dum_positions -= positions_needed
-                    is_continuing_split = True  # Mark that next partial continues this DUM
-                    break
+                    if partial_end < cum_weights[dum_idx + 1] - _WEIGHT_EPSILON:
+                        # Split the DUM - this is the last DUM for this partial
+                        # Calculate positions to reach the target partial_positions
+                        weight_needed = partial_weight - weight_accumulated
+                        positions_needed = partial_positions - positions_accumulated
+                        
+                        partial_dums.append(DumSlice(
+                            dum_number, weight_needed, positions_needed,
+                            True, f"{dum_number}/{partial_idx + 1}"
+                        ))
+                        self._record_split(split_dums, partial_idx, partial_dums[-1])
+                        weight_accumulated += weight_needed
+                        positions_accumulated += positions_needed
+                        
+                        # Next partial continues this DUM
+                        remaining_positions = split_dum_positions if is_continuing_split else dum_positions[dum_idx]
+                        split_dum_positions = remaining_positions - positions_needed
+                    else:
+                        # Take entire remaining DUM (or remaining part of split DUM)
+                        if is_continuing_split:
+                            portion_weight = cum_weights[dum_idx + 1] - partial_start
+                            portion_positions = split_dum_positions
+                        else:
+                            portion_weight = dum_weights[dum_idx]
+                            portion_positions = dum_positions[dum_idx]
+                        
+                        partial_dums.append(DumSlice(
+                            dum_number, portion_weight, portion_positions, is_continuing_split,
+                            f"{dum_number}/{partial_idx + 1}" if is_continuing_split else ''
+                        ))
+                        if is_continuing_split:
+                            self._record_split(split_dums, partial_idx, partial_dums[-1])
+                        weight_accumulated += portion_weight
+                        positions_accumulated += portion_positions
+            
+            partial_start = partial_end
             
             distribution.append({
                 'weight': weight_accumulated,
@@ -530,235 +879,231 @@ class PartialConfigDialog:
                 'dums': partial_dums
             })
         
-        return distribution
+        return distribution, dict(split_dums)
     
-    def _save_config(self):
-        """Validate and save configuration"""
-        try:
-            # Validate LTA data first
-            if not self.lta_data.get('dums') or self.lta_data.get('total_weight', 0) <= 0:
-                messagebox.showerror(
-                    "Erreur",
-                    "Données LTA invalides.\n\n"
-                    "Le LTA doit avoir:\n"
-                    "- Un poids total > 0\n"
-                    "- Au moins un DUM\n\n"
-                    "Vérifiez le fichier Excel du LTA."
-                )
-                return
+    def _proportional_positions(self, partial_weights):
+        """
+        Positions of each partial, proportional to its share of the LTA weight
+        
+        Kept as round(w * P / W) per weight: a precomputed positions-per-kg ratio
+        rounds differently on exact .5 ties.
+        """
+        total_lta_weight = self.lta_data['total_weight']
+        total_lta_positions = self.lta_data['total_positions']
+        if total_lta_weight <= 0:
+            return [0] * len(partial_weights)
+        return [round((weight * total_lta_positions) / total_lta_weight) for weight in partial_weights]
+    
+    @staticmethod
+    def _record_split(split_dums, partial_idx, dum_info):
+        """Add a split DUM portion to the split_dums summary"""
+        split = split_dums[str(dum_info.dum_number)]
+        split['total_weight'] += dum_info.weight
+        split['splits'].append({
+            'partial': partial_idx + 1,
+            'split_id': dum_info.split_id,
+            'weight': dum_info.weight,
+            'positions': dum_info.positions
+        })
+    
+    def _collect_config(self):
+        """
+        Read and validate the forms, and build the partial configuration
+        
+        Returns:
+            Tuple (config, error): config is None when validation fails, error is
+            None or (title, message) for the first problem found
+        """
+        # Validate LTA data first
+        if not self.lta_data.get('dums') or self.lta_data.get('total_weight', 0) <= 0:
+            return None, (
+                "Erreur",
+                "Données LTA invalides.\n\n"
+                "Le LTA doit avoir:\n"
+                "- Un poids total > 0\n"
+                "- Au moins un DUM\n\n"
+                "Vérifiez le fichier Excel du LTA."
+            )
+        
+        # Read and validate every form once, the distribution needs all the weights
+        partial_weights = []
+        form_fields = []
+        for form_data in self.partial_forms:
+            partial_num = form_data['partial_number']
+            weight = form_data['weight_var'].get().strip()
+            ds_serie = form_data['ds_serie_var'].get().strip()
+            ds_cle = form_data['ds_cle_var'].get().strip()
+            location = form_data['location_var'].get().strip()
             
-            # Collect data from forms
-            partials = []
-            total_weight_check = 0
+            if not _NUMERIC_RE.match(weight):
+                return None, ("Erreur", f"Poids invalide pour Partiel {partial_num}")
             
-            # First collect partial weights to calculate distribution
-            partial_weights = []
-            for form_data in self.partial_forms:
-                try:
-                    weight = float(form_data['weight_var'].get().strip())
-                    partial_weights.append(weight)
-                except ValueError:
-                    messagebox.showerror("Erreur", f"Poids invalide pour Partiel {form_data['partial_number']}")
-                    return
+            # Validate required fields
+            if not all([ds_serie, ds_cle, location]):
+                return None, ("Validation", f"Partiel {partial_num}: Tous les champs sont requis")
             
-            # Calculate DUM distribution automatically
-            distribution = self._calculate_dum_distribution(partial_weights)
+            partial_weights.append(float(weight))
+            form_fields.append((partial_num, ds_serie, ds_cle, location))
+        
+        # Detect exception case up front, the exception-only fields are
+        # only read when it applies. Unlike the preview, which ignores weights
+        # not entered yet, the saved rule also counts zero or negative weights.
+        smallest_partial_weight = min(partial_weights)
+        is_exception_case = smallest_partial_weight < self._min_dum_weight
+        exception_partial_idx = (partial_weights.index(smallest_partial_weight)
+                                 if is_exception_case else None)
+        
+        # Calculate DUM distribution automatically (split DUMs are collected on the way)
+        distribution, split_dums = self._calculate_dum_distribution(partial_weights)
+        
+        # Build partials configuration using calculated distribution
+        partials = []
+        for (partial_num, ds_serie, ds_cle, location), weight, partial_dist in zip(
+                form_fields, partial_weights, distribution):
+            selected_dums = [dum_info._asdict() for dum_info in partial_dist['dums']]
             
-            # Build partials configuration using calculated distribution
-            for idx, form_data in enumerate(self.partial_forms):
-                partial_num = form_data['partial_number']
-                
-                # Validate required fields
-                weight = form_data['weight_var'].get().strip()
-                ds_serie = form_data['ds_serie_var'].get().strip()
-                ds_cle = form_data['ds_cle_var'].get().strip()
-                location = form_data['location_var'].get().strip()
-                
-                if not all([weight, ds_serie, ds_cle, location]):
-                    messagebox.showerror(
-                        "Validation",
-                        f"Partiel {partial_num}: Tous les champs sont requis"
-                    )
-                    return
-                
-                # Validate weight
-                try:
-                    weight_float = float(weight)
-                    total_weight_check += weight_float
-                except ValueError:
-                    messagebox.showerror(
-                        "Validation",
-                        f"Partiel {partial_num}: Poids invalide"
-                    )
-                    return
-                
-                # Get DUMs from calculated distribution
-                partial_dist = distribution[idx]
-                selected_dums = []
-                
-                for dum_info in partial_dist['dums']:
-                    selected_dums.append({
-                        'dum_number': dum_info['dum_number'],
-                        'weight': dum_info['weight'],
-                        'positions': dum_info['positions'],
-                        'is_split': dum_info['is_split'],
-                        'split_id': dum_info.get('split_id', '')
-                    })
-                
-                # Validate distribution has DUMs
-                if not selected_dums:
-                    messagebox.showerror(
-                        "Validation",
-                        f"Partiel {partial_num}: Aucun DUM assigné par distribution automatique"
-                    )
-                    return
-                
-                partials.append({
-                    'partial_number': partial_num,
-                    'weight': weight_float,
-                    'positions': partial_dist['positions'],
-                    'ds_serie': ds_serie,
-                    'ds_cle': ds_cle,
-                    'loading_location': location,
-                    'dums': selected_dums
-                })
-            
-            # Validate weight tolerance (allow 1% difference)
-            weight_diff = abs(total_weight_check - self.lta_data['total_weight'])
-            weight_tolerance = self.lta_data['total_weight'] * 0.01
-            
-            if weight_diff > weight_tolerance:
-                response = messagebox.askyesno(
-                    "Attention",
-                    f"La somme des poids partiels ({total_weight_check} kg) ne correspond pas exactement au poids total ({self.lta_data['total_weight']} kg).\n\n"
-                    f"Différence: {weight_diff:.2f} kg\n\n"
-                    "Continuer quand même?"
+            # Validate distribution has DUMs
+            if not selected_dums:
+                return None, (
+                    "Validation",
+                    f"Partiel {partial_num}: Aucun DUM assigné par distribution automatique"
                 )
-                if not response:
-                    return
-            
-            # Detect split DUMs from distribution
-            split_dums = {}
-            for partial in partials:
-                for dum in partial['dums']:
-                    if dum['is_split']:
-                        dum_num = str(dum['dum_number'])
-                        if dum_num not in split_dums:
-                            split_dums[dum_num] = {
-                                'total_weight': 0,
-                                'splits': []
-                            }
-                        
-                        split_dums[dum_num]['total_weight'] += dum['weight']
-                        split_dums[dum_num]['splits'].append({
-                            'partial': partial['partial_number'],
-                            'split_id': dum['split_id'],
-                            'weight': dum['weight'],
-                            'positions': dum['positions']
-                        })
-            
-            # Detect exception case
-            smallest_dum_weight = min(dum['weight'] for dum in self.lta_data['dums'])
-            smallest_partial_weight = min(partial_weights)
-            is_exception_case = smallest_partial_weight < smallest_dum_weight
-            
-            # For exception case, validate additional fields
-            smallest_partial_number = None
-            smallest_partial_positions = None
-            airport_reference = None
-            
-            if is_exception_case:
-                # Find which partial is the smallest
-                for idx, weight in enumerate(partial_weights):
-                    if weight == smallest_partial_weight:
-                        smallest_partial_number = idx + 1
-                        break
-                
-                # Validate exception case fields
-                airport_reference = self.airport_reference_var.get().strip()
-                smallest_partial_positions_str = self.smallest_partial_positions_var.get().strip()
-                
-                if not airport_reference:
-                    messagebox.showerror(
-                        "Validation",
-                        "Cas d'exception détecté: Veuillez renseigner la référence créée à l'aéroport"
-                    )
-                    return
-                
-                if not smallest_partial_positions_str:
-                    messagebox.showerror(
-                        "Validation",
-                        "Cas d'exception détecté: Veuillez renseigner les positions du plus petit partiel"
-                    )
-                    return
-                
-                try:
-                    smallest_partial_positions = int(smallest_partial_positions_str)
-                    if smallest_partial_positions <= 0:
-                        raise ValueError("Positions must be positive")
-                except ValueError:
-                    messagebox.showerror(
-                        "Validation",
-                        "Positions du plus petit partiel: valeur invalide (doit être un nombre > 0)"
-                    )
-                    return
-            
-            # Build config
-            config = {
-                'lta_reference': self._get_lta_reference(),
-                'lta_total_weight': self.lta_data['total_weight'],
-                'lta_total_positions': self.lta_data['total_positions'],
-                'partial_type': 'exception' if is_exception_case else 'normal',
-                'partials': partials,
-                'split_dums': split_dums
-            }
             
-            # Add exception case fields if applicable
-            if is_exception_case:
-                config['smallest_partial_number'] = smallest_partial_number
-                config['smallest_partial_positions'] = smallest_partial_positions
-                config['smallest_partial_airport_reference'] = airport_reference
+            partials.append({
+                'partial_number': partial_num,
+                'weight': weight,
+                'positions': partial_dist['positions'],
+                'ds_serie': ds_serie,
+                'ds_cle': ds_cle,
+                'loading_location': location,
+                'dums': selected_dums
+            })
+        
+        config = {
+            'lta_reference': self.lta_reference,
+            'lta_total_weight': self.lta_data['total_weight'],
+            'lta_total_positions': self.lta_data['total_positions'],
+            'partial_type': 'exception' if is_exception_case else 'normal',
+            'partials': partials,
+            'split_dums': split_dums
+        }
+        
+        # For exception case, validate additional fields
+        if is_exception_case:
+            airport_reference = self.airport_reference_var.get().strip()
+            smallest_partial_positions_str = self.smallest_partial_positions_var.get().strip()
+            
+            if not airport_reference:
+                return None, (
+                    "Validation",
+                    "Cas d'exception détecté: Veuillez renseigner la référence créée à l'aéroport"
+                )
+            
+            if not smallest_partial_positions_str:
+                return None, (
+                    "Validation",
+                    "Cas d'exception détecté: Veuillez renseigner les positions du plus petit partiel"
+                )
             
-            # Save config
+            try:
+                smallest_partial_positions = int(smallest_partial_positions_str)
+            except ValueError:
+                smallest_partial_positions = 0
+            if smallest_partial_positions <= 0:
+                return None, (
+                    "Validation",
+                    "Positions du plus petit partiel: valeur invalide (doit être un nombre > 0)"
+                )
+            
+            config['smallest_partial_number'] = exception_partial_idx + 1
+            config['smallest_partial_positions'] = smallest_partial_positions
+            config['smallest_partial_airport_reference'] = airport_reference
+        
+        return config, None
+    
+    def _save_config(self):
+        """Validate and save configuration"""
+        config, error = self._collect_config()
+        if error:
+            messagebox.showerror(*error)
+            return
+        
+        # Validate weight tolerance (allow 1% difference), only asked once everything else is valid.
+        # Compared in whole grams so float drift in the sum never triggers the question
+        total_weight_check_g = sum(round(partial['weight'] * 1000) for partial in config['partials'])
+        lta_weight_g = round(self.lta_data['total_weight'] * 1000)
+        weight_diff_g = abs(total_weight_check_g - lta_weight_g)
+        
+        if weight_diff_g * 100 > lta_weight_g:
+            response = messagebox.askyesno(
+                "Attention",
+                f"La somme des poids partiels ({total_weight_check_g / 1000} kg) ne correspond pas exactement au poids total ({self.lta_data['total_weight']} kg).\n\n"
+                f"Différence: {weight_diff_g / 1000:.2f} kg\n\n"
+                "Continuer quand même?"
+            )
+            if not response:
+                return
+        
+        # Save config
+        try:
             success = save_lta_partial_config(
                 self.lta_folder_path,
                 self.folder_name,
                 config
             )
-            
-            if success:
-                self.config_saved = True
-                messagebox.showinfo("Succès", "Configuration sauvegardée!")
-                self.dialog.destroy()
-            else:
-                messagebox.showerror("Erreur", "Impossible de sauvegarder la configuration")
-                
         except Exception as e:
-            logger.error(f"Error saving partial config: {e}", exc_info=True)
+            # Only unexpected errors need a traceback in the log
+            logger.error(f"Error saving partial config: {e}", exc_info=not isinstance(e, (ValueError, OSError)))
             messagebox.showerror("Erreur", f"Erreur lors de la sauvegarde:\n{e}")
+            return
+        
+        if success:
+            self.config_saved = True
+            messagebox.showinfo("Succès", "Configuration sauvegardée!")
+            self.dialog.destroy()
+        else:
+            messagebox.showerror("Erreur", "Impossible de sauvegarder la configuration")
     
-    def _get_lta_reference(self):
+    @cached_property
+    def lta_reference(self):
+        """LTA reference from the LTA file, read once per dialog"""
+        return self._compute_lta_reference()
+    
+    def _compute_lta_reference(self):
         """Get LTA reference from LTA file"""
         try:
-            lta_file_patterns = [
-                f"{self.folder_name}.txt",
-                f"{self.folder_name.replace(' ', '')}.txt",
-                f"{self.folder_name.lower().replace(' ', '')}.txt"
-            ]
-            
-            for pattern in lta_file_patterns:
-                lta_file = os.path.join(self.lta_folder_path, pattern)
-                if os.path.exists(lta_file):
-                    with open(lta_file, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                    if len(lines) >= 4:
-                        reference = lines[3].strip()  # Line 4 (index 3)
-                        # Remove /1 suffix if present
-                        if reference.endswith('/1'):
-                            reference = reference[:-2]
-                        return reference
+            # Use the LTA file given by the caller, otherwise look it up by folder name
+            if self.lta_file_path and os.path.isfile(self.lta_file_path):
+                lta_files = [self.lta_file_path]
+            else:
+                lta_file_patterns = [
+                    f"{self.folder_name}.txt",
+                    f"{self.folder_name.replace(' ', '')}.txt",
+                    f"{self.folder_name.lower().replace(' ', '')}.txt"
+                ]
+                
+                # List the folder once instead of probing each pattern with os.path.exists.
+                # normcase compares names like the filesystem does: exact on Linux,
+                # case-insensitive on Windows
+                with os.scandir(self.lta_folder_path) as entries:
+                    txt_files = {os.path.normcase(entry.name): entry.path
+                                 for entry in entries if entry.is_file()}
+                lta_files = [txt_files[os.path.normcase(pattern)] for pattern in lta_file_patterns
+                             if os.path.normcase(pattern) in txt_files]
             
-            return "UNKNOWN"
+            reference = "UNKNOWN"
+            for lta_file in lta_files:
+                # Only line 4 is needed, stop reading there
+                with open(lta_file, 'r', encoding='utf-8') as f:
+                    line_4 = next(islice(f, 3, 4), None)
+                if line_4 is not None:
+                    reference = line_4.strip()
+                    # Remove /1 suffix if present
+                    if reference.endswith('/1'):
+                        reference = reference[:-2]
+                    break
+            
+            return reference
             
         except Exception as e:
             logger.error(f"Error getting LTA reference: {e}")
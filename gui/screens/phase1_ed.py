@@ -5,15 +5,97 @@ Handles Etat de Dépotage creation and signed series entry
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkfont
 import logging
+import threading
 
 from gui.utils.script_manager import ScriptManager
-from gui.utils.file_utils import detect_ltas, write_lta_signed_series
-from gui.utils.validators import validate_credentials, validate_signed_series, normalize_ds_series
+from gui.utils.file_utils import (
+    detect_ltas, lta_folder_signature, write_lta_signed_series, update_partial_signed_series
+)
+from gui.utils.validators import validate_credentials, normalize_and_validate_batch
 
 logger = logging.getLogger(__name__)
 
+# How often the Tk thread checks whether background file I/O has finished
+_BACKGROUND_POLL_MS = 50
+
+# Progress from the Phase 1 script is painted at most this often (~30 fps)
+_PROGRESS_FLUSH_MS = 33
+
+
+def _table_rows(ltas):
+    """
+    Precompute the Phase 1 table rows, without touching Tk
+    
+    Args:
+        ltas: LTAs with DS series, as returned by detect_ltas()
+        
+    Returns:
+        List of tuples (parent_iid, iid, values, tags, input_data); input_data
+        is None for the header row of a partial LTA
+    """
+    rows = []
+    
+    for idx, lta in enumerate(ltas):
+        lta_iid = f"lta{idx}"
+        
+        # Check if partial LTA
+        if lta.get('is_partial') and lta.get('partial_config'):
+            # PARTIAL LTA - Header row with one child row per partial
+            partials = lta['partial_config'].get('partials', [])
+            
+            lta_display = f"{lta['name']} - {lta.get('lta_reference', 'N/A')} 📦 ({len(partials)} partiels)"
+            rows.append(("", lta_iid, ("☑", lta_display, "", "", "", "", ""), ("group",), None))
+            
+            for partial in partials:
+                partial_num = partial['partial_number']
+                validated_ds = partial.get('ds_validated') or ''
+                existing_signed = partial.get('signed_series') or ''
+                
+                values = (
+                    "",
+                    f"  └ Partiel {partial_num}",
+                    f"{partial['ds_serie']}/{partial['ds_cle']}",
+                    validated_ds or "En attente",
+                    "📋" if validated_ds else "",
+                    existing_signed,
+                    "⏸️"
+                )
+                # Input kept for later saving
+                input_data = {
+                    'lta': lta,
+                    'partial_number': partial_num,
+                    'validated_ds': validated_ds,
+                    'signed_series': existing_signed,
+                    'is_partial': True
+                }
+                rows.append((lta_iid, f"{lta_iid}.p{partial_num}", values,
+                             ("validated",) if validated_ds else (), input_data))
+        else:
+            # REGULAR LTA - Single row
+            validated_ds = lta.get('validated_ds') or ''
+            existing_signed = lta.get('signed_ds') or ''
+            
+            values = (
+                "☑",
+                f"{lta['name']} - {lta.get('lta_reference', 'N/A')}",
+                lta.get('ds_series', 'N/A'),
+                validated_ds or "En attente",
+                "📋 Copier" if validated_ds else "",
+                existing_signed,
+                "✅" if existing_signed else "⏸️"
+            )
+            input_data = {
+                'lta': lta,
+                'validated_ds': validated_ds,
+                'signed_series': existing_signed,
+                'is_partial': False
+            }
+            rows.append(("", lta_iid, values, ("validated",) if validated_ds else (), input_data))
+    
+    return rows
+
 class Phase1EDScreen:
     """Screen 2: Phase 1 - Etat de Dépotage"""
     
@@ -23,7 +105,18 @@ class Phase1EDScreen:
         self.frame = ttk.Frame(parent)
         self.script_manager = ScriptManager(app)
         self.ltas_with_ds = []
-        self.lta_inputs = []
+        self._ltas_cache = None  # (folder, signature, ltas)
+        self._refreshing = False
+        self.tree = None
+        self._inputs_by_iid = {}
+        self._selected = set()
+        self._signed_editor = None
+        self._invalid_iids = set()
+        self._pending_progress = None
+        self._pending_logs = []
+        self._progress_flush_scheduled = False
+        # Named font shared by the tree tags instead of a tuple resolved per tag
+        self._bold_font = tkfont.Font(family='Arial', size=9, weight='bold')
         self._setup_ui()
     
     def _setup_ui(self):
@@ -165,11 +258,30 @@ class Phase1EDScreen:
             )
             return
         
-        # Detect LTAs
-        all_ltas = detect_ltas(self.app.current_folder)
+        if self._refreshing:
+            return
+        self._refreshing = True
         
-        # Filter only those with DS series
-        self.ltas_with_ds = [lta for lta in all_ltas if lta.get('has_ds')]
+        # Detect LTAs in the background, the dossier may be on a slow share
+        previous_status = self.status_var.get()
+        self.status_var.set("⏳ Chargement des LTAs...")
+        
+        def detect():
+            # Row strings are prepared here too, off the Tk thread
+            ltas = self._detect_ltas()
+            return ltas, _table_rows(ltas)
+        
+        def on_detected(result):
+            self._refreshing = False
+            self.status_var.set(previous_status)
+            self._show_ltas(*(result or ([], [])))
+        
+        self._run_in_background(detect, on_detected)
+    
+    def _show_ltas(self, all_ltas, rows=None):
+        """Show the detected LTAs that have a DS series"""
+        # detect_ltas() already dropped the LTAs without DS series
+        self.ltas_with_ds = all_ltas
         
         if not self.ltas_with_ds:
             messagebox.showinfo(
@@ -186,295 +298,300 @@ class Phase1EDScreen:
         )
         
         # Show unified table
-        self.populate_lta_table()
+        self.populate_lta_table(rows)
         self.start_btn.config(state="normal")
         self.save_btn.config(state="normal")
     
+    def _run_in_background(self, work, on_done):
+        """
+        Run work() in a thread and pass its result to on_done() on the Tk thread
+        
+        Args:
+            work: Callable doing file I/O only (no Tk calls)
+            on_done: Callable receiving work()'s result, or None if it raised
+        """
+        result = {}
+        
+        def target():
+            try:
+                result['value'] = work()
+            except Exception as e:
+                logger.error(f"Background task failed: {e}", exc_info=True)
+        
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        
+        def poll():
+            if thread.is_alive():
+                self.frame.after(_BACKGROUND_POLL_MS, poll)
+            else:
+                on_done(result.get('value'))
+        
+        self.frame.after(_BACKGROUND_POLL_MS, poll)
+    
+    def _detect_ltas(self):
+        """detect_ltas() for the current folder, reused while its files are unchanged"""
+        folder = self.app.current_folder
+        signature = lta_folder_signature(folder)
+        
+        if signature is not None and self._ltas_cache:
+            cached_folder, cached_signature, ltas = self._ltas_cache
+            if cached_folder == folder and cached_signature == signature:
+                return ltas
+        
+        ltas = detect_ltas(folder, filter_has_ds=True)
+        self._ltas_cache = (folder, signature, ltas) if signature is not None else None
+        return ltas
+    
     def _on_selection_mode_change(self):
         """Handle selection mode change"""
-        mode = self.selection_mode.get()
+        # Manual mode starts from the current marks, nothing to redraw
+        if self.selection_mode.get() != "all":
+            return
         
-        if hasattr(self, 'checkbox_widgets') and self.checkbox_widgets:
-            if mode == "all":
-                for cb_var, cb_widget in zip(self.lta_checkboxes, self.checkbox_widgets):
-                    cb_var.set(True)
-                    cb_widget.config(state="disabled")
-            else:
-                for cb_widget in self.checkbox_widgets:
-                    cb_widget.config(state="normal")
+        # Only the LTAs unticked in manual mode need their mark redrawn
+        unticked = set(range(len(self.ltas_with_ds))) - self._selected
+        self._selected |= unticked
+        if self.tree is not None:
+            for idx in unticked:
+                self.tree.set(f"lta{idx}", "sel", "☑")
+    
+    def _toggle_selection(self, idx):
+        """Toggle an LTA in/out of the manual selection"""
+        if self.selection_mode.get() == "all":
+            return
+        self._selected ^= {idx}
+        self.tree.set(f"lta{idx}", "sel", "☑" if idx in self._selected else "☐")
     
-    def populate_lta_table(self):
-        """Populate unified table with LTAs and all their information in one view"""
-        # Clear existing
+    def _build_tree(self):
+        """Create the LTA Treeview once; later refreshes only replace its rows"""
         if self.table_label:
             self.table_label.destroy()
-        for widget in self.table_frame.winfo_children():
-            widget.destroy()
-        
-        # Create main container
-        main_container = ttk.Frame(self.table_frame)
-        main_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        main_container.columnconfigure(0, weight=1)
-        main_container.rowconfigure(0, weight=1)
-        
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(main_container, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-        
-        table_content = ttk.Frame(canvas)
+            self.table_label = None
         
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        columns = ("sel", "lta", "ds", "val", "action", "signed", "status")
+        tree = ttk.Treeview(
+            self.table_frame,
+            columns=columns,
+            show="headings",
+            selectmode="extended"
+        )
+        scrollbar = ttk.Scrollbar(self.table_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        canvas_window = canvas.create_window((0, 0), window=table_content, anchor="nw")
-        
-        # Configure content columns to be responsive
-        table_content.columnconfigure(0, weight=0, minsize=40)   # Checkbox
-        table_content.columnconfigure(1, weight=1, minsize=200)  # LTA name + reference
-        table_content.columnconfigure(2, weight=1, minsize=120)  # DS Série
-        table_content.columnconfigure(3, weight=1, minsize=120)  # DS Validé
-        table_content.columnconfigure(4, weight=0, minsize=80)   # Copy button
-        table_content.columnconfigure(5, weight=1, minsize=120)  # Série Signée
-        table_content.columnconfigure(6, weight=0, minsize=40)   # Status
-        
-        # Headers
+        # Headers and column sizes
         headers = [
-            ("☑", 0),
-            ("LTA", 1),
-            ("DS Série", 2),
-            ("DS Validé", 3),
-            ("Action", 4),
-            ("Série Signée", 5),
-            ("✓", 6)
+            ("sel", "☑", 40, False),
+            ("lta", "LTA", 260, True),
+            ("ds", "DS Série", 120, True),
+            ("val", "DS Validé", 120, True),
+            ("action", "Action", 80, False),
+            ("signed", "Série Signée", 120, True),
+            ("status", "✓", 40, False)
         ]
+        for col, text, width, stretch in headers:
+            tree.heading(col, text=text, anchor=tk.W)
+            tree.column(col, width=width, minwidth=width, stretch=stretch,
+                        anchor=tk.CENTER if not stretch else tk.W)
+        
+        tree.tag_configure("group", font=self._bold_font)
+        tree.tag_configure("validated", foreground="darkgreen")
+        tree.tag_configure("invalid", background="#ffd6d6", foreground="red")
+        
+        tree.bind("<Button-1>", self._on_tree_click)
+        tree.bind("<Double-1>", self._on_tree_double_click)
+        tree.bind("<Return>", self._on_tree_return)
+        tree.bind("<space>", self._on_tree_space)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(sequence, self._commit_signed_editor, add="+")
+        
+        self.tree = tree
+    
+    def populate_lta_table(self, rows=None):
+        """
+        Populate unified table with LTAs and all their information in one view
+        
+        Args:
+            rows: Output of _table_rows(self.ltas_with_ds), computed here if not given
+        """
+        if rows is None:
+            rows = _table_rows(self.ltas_with_ds)
+        
+        if self.tree is None:
+            self._build_tree()
+        else:
+            self._commit_signed_editor()
+            self.tree.delete(*self.tree.get_children())
         
-        for text, col in headers:
-            header = ttk.Label(
-                table_content,
-                text=text,
-                font=('Arial', 9, 'bold')
-            )
-            header.grid(row=0, column=col, padx=5, pady=5, sticky=tk.W)
+        tree = self.tree
+        self._inputs_by_iid = {}
+        self._invalid_iids = set()
+        self._selected = set(range(len(self.ltas_with_ds)))
         
-        # Separator
-        ttk.Separator(table_content, orient='horizontal').grid(
-            row=1, column=0, columnspan=7, sticky=(tk.W, tk.E), pady=5
-        )
+        for parent, iid, values, tags, input_data in rows:
+            tree.insert(parent, "end", iid=iid, open=True, tags=tags, values=values)
+            if input_data:
+                self._inputs_by_iid[iid] = input_data
         
-        # Populate rows
-        self.lta_inputs = []
-        self.lta_checkboxes = []
-        self.checkbox_widgets = []
-        
-        current_row = 2
-        for idx, lta in enumerate(self.ltas_with_ds):
-            # Checkbox
-            cb_var = tk.BooleanVar(value=True)
-            self.lta_checkboxes.append(cb_var)
-            cb = ttk.Checkbutton(
-                table_content,
-                variable=cb_var,
-                state="disabled" if self.selection_mode.get() == "all" else "normal"
-            )
-            cb.grid(row=current_row, column=0, padx=5, pady=3, sticky=tk.N)
-            self.checkbox_widgets.append(cb)
-            
-            # Check if partial LTA
+        self.app.log_message("Table Phase 1 affichée", "INFO")
+    
+    @staticmethod
+    def _table_layout(ltas):
+        """Row structure of the table: LTA names and their partial numbers"""
+        return [
+            (lta['name'], tuple(p['partial_number'] for p in lta['partial_config'].get('partials', []))
+             if lta.get('is_partial') and lta.get('partial_config') else None)
+            for lta in ltas
+        ]
+    
+    def _apply_validated_ds(self):
+        """Update the 'DS Validé' cells in place after Phase 1"""
+        self._run_in_background(self._detect_ltas, self._on_validated_ds_detected)
+    
+    def _on_validated_ds_detected(self, all_ltas):
+        """Apply the LTAs re-read after Phase 1 to the table"""
+        ltas = all_ltas or []
+        
+        # New or removed LTAs/partials need the full rebuild
+        if self.tree is None or self._table_layout(ltas) != self._table_layout(self.ltas_with_ds):
+            self.refresh_lta_list()
+            return
+        
+        for idx, lta in enumerate(ltas):
+            lta_iid = f"lta{idx}"
             if lta.get('is_partial') and lta.get('partial_config'):
-                # PARTIAL LTA - Create expandable rows for each partial
-                partials = lta['partial_config'].get('partials', [])
-                
-                # Main LTA header row
-                lta_display = f"{lta['name']} - {lta.get('lta_reference', 'N/A')} 📦 ({len(partials)} partiels)"
-                lta_label = ttk.Label(
-                    table_content, 
-                    text=lta_display,
-                    font=('Arial', 9, 'bold')
-                )
-                lta_label.grid(row=current_row, column=1, padx=5, pady=3, sticky=tk.W, rowspan=len(partials))
-                current_row += 1
-                
-                # Create a row for each partial
-                for partial in partials:
-                    partial_num = partial['partial_number']
-                    
-                    # Indent for sub-item
-                    ttk.Label(
-                        table_content,
-                        text=f"  └ Partiel {partial_num}",
-                        foreground="gray"
-                    ).grid(row=current_row, column=1, padx=20, pady=2, sticky=tk.W)
-                    
-                    # DS Série for this partial
-                    ds_serie = f"{partial['ds_serie']}/{partial['ds_cle']}"
-                    ttk.Label(
-                        table_content,
-                        text=ds_serie,
-                        foreground="purple"
-                    ).grid(row=current_row, column=2, padx=5, pady=2, sticky=tk.W)
-                    
-                    # DS Validé (read from partial config)
-                    validated_ds = partial.get('ds_validated', '')
-                    if validated_ds:
-                        validated_label = ttk.Label(
-                            table_content,
-                            text=validated_ds,
-                            font=('Arial', 9, 'bold'),
-                            foreground="darkgreen"
-                        )
-                        validated_label.grid(row=current_row, column=3, padx=5, pady=2, sticky=tk.W)
-                        
-                        # Copy button for partial DS
-                        def make_copy_command_partial(text, lta_name, p_num):
-                            def copy_to_clipboard():
-                                self.frame.clipboard_clear()
-                                self.frame.clipboard_append(text)
-                                self.app.log_message(f"DS copié: {text} ({lta_name} Partiel {p_num})", "SUCCESS")
-                            return copy_to_clipboard
-                        
-                        copy_btn = ttk.Button(
-                            table_content,
-                            text="📋",
-                            width=5,
-                            command=make_copy_command_partial(validated_ds, lta['name'], partial_num)
-                        )
-                        copy_btn.grid(row=current_row, column=4, padx=2, pady=2)
-                    else:
-                        ttk.Label(
-                            table_content,
-                            text="En attente",
-                            foreground="gray",
-                            font=('Arial', 9, 'italic')
-                        ).grid(row=current_row, column=3, padx=5, pady=2, sticky=tk.W)
-                    
-                    # Signed series input for this partial (load existing if available)
-                    existing_signed = partial.get('signed_series', '')
-                    signed_var = tk.StringVar(value=existing_signed if existing_signed else "")
-                    signed_entry = ttk.Entry(table_content, textvariable=signed_var, width=15)
-                    signed_entry.grid(row=current_row, column=5, padx=5, pady=2, sticky=(tk.W, tk.E))
-                    
-                    # Store input for later saving
-                    self.lta_inputs.append({
-                        'lta': lta,
-                        'partial_number': partial_num,
-                        'signed_var': signed_var,
-                        'is_partial': True
-                    })
-                    
-                    # Status icon
-                    ttk.Label(
-                        table_content,
-                        text="⏸️",
-                        font=('Arial', 11),
-                        foreground="gray"
-                    ).grid(row=current_row, column=6, padx=5, pady=2)
-                    
-                    current_row += 1
-                
-            else:
-                # REGULAR LTA - Single row
-                lta_display = f"{lta['name']} - {lta.get('lta_reference', 'N/A')}"
-                lta_label = ttk.Label(table_content, text=lta_display)
-                lta_label.grid(row=current_row, column=1, padx=5, pady=3, sticky=tk.W)
-                
-                # DS Série
-                ds_serie = lta.get('ds_series', 'N/A')
-                ds_label = ttk.Label(
-                    table_content,
-                    text=ds_serie,
-                    foreground="blue" if ds_serie != 'N/A' else "gray"
-                )
-                ds_label.grid(row=current_row, column=2, padx=5, pady=3, sticky=tk.W)
-                
-                # DS Validé
-                validated_ds = lta.get('validated_ds', '')
-                if validated_ds:
-                    validated_label = ttk.Label(
-                        table_content,
-                        text=validated_ds,
-                        font=('Arial', 9, 'bold'),
-                        foreground="darkgreen"
+                for partial in lta['partial_config'].get('partials', []):
+                    self._set_validated_ds(
+                        f"{lta_iid}.p{partial['partial_number']}",
+                        partial.get('ds_validated') or '',
+                        "📋"
                     )
-                    validated_label.grid(row=current_row, column=3, padx=5, pady=3, sticky=tk.W)
-                    
-                    # Copy button
-                    def make_copy_command(text, lta_name):
-                        def copy_to_clipboard():
-                            self.frame.clipboard_clear()
-                            self.frame.clipboard_append(text)
-                            self.app.log_message(f"DS copié: {text} ({lta_name})", "SUCCESS")
-                        return copy_to_clipboard
-                    
-                    copy_btn = ttk.Button(
-                        table_content,
-                        text="📋 Copier",
-                        width=10,
-                        command=make_copy_command(validated_ds, lta['name'])
-                    )
-                    copy_btn.grid(row=current_row, column=4, padx=5, pady=3)
-                else:
-                    ttk.Label(
-                        table_content,
-                        text="En attente",
-                        foreground="gray",
-                        font=('Arial', 9, 'italic')
-                    ).grid(row=current_row, column=3, padx=5, pady=3, sticky=tk.W)
-                
-                # Signed series input
-                existing_signed = lta.get('signed_ds', '')
-                signed_var = tk.StringVar(value=existing_signed)
-                signed_entry = ttk.Entry(table_content, textvariable=signed_var, width=15)
-                signed_entry.grid(row=current_row, column=5, padx=5, pady=3, sticky=(tk.W, tk.E))
-                
-                # Store input
-                self.lta_inputs.append({
-                    'lta': lta,
-                    'signed_var': signed_var,
-                    'is_partial': False
-                })
-                
-                # Status icon
-                status_var = tk.StringVar(value="✅" if existing_signed else "⏸️")
-                status_label = ttk.Label(
-                    table_content,
-                    textvariable=status_var,
-                    font=('Arial', 11),
-                    foreground="green" if existing_signed else "gray"
-                )
-                status_label.grid(row=current_row, column=6, padx=5, pady=3)
-                
-                current_row += 1
-        
-        # Configure scrolling
-        def configure_scroll_region(event=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas_width = canvas.winfo_width()
-            canvas.itemconfig(canvas_window, width=canvas_width)
-        
-        table_content.bind("<Configure>", configure_scroll_region)
-        canvas.bind("<Configure>", configure_scroll_region)
-        
-        # Fix mousewheel scrolling
-        def on_mousewheel(event):
-            if event.num == 5 or event.delta < 0:
-                canvas.yview_scroll(1, "units")
-            elif event.num == 4 or event.delta > 0:
-                canvas.yview_scroll(-1, "units")
-        
-        def bind_mousewheel(widget):
-            widget.bind("<MouseWheel>", on_mousewheel)
-            widget.bind("<Button-4>", on_mousewheel)
-            widget.bind("<Button-5>", on_mousewheel)
-            for child in widget.winfo_children():
-                bind_mousewheel(child)
-        
-        bind_mousewheel(table_content)
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        canvas.bind("<Button-4>", on_mousewheel)
-        canvas.bind("<Button-5>", on_mousewheel)
+            else:
+                self._set_validated_ds(lta_iid, lta.get('validated_ds') or '', "📋 Copier")
+    
+    def _set_validated_ds(self, iid, validated_ds, copy_text):
+        """Update one row's validated DS if it changed"""
+        input_data = self._inputs_by_iid[iid]
+        if input_data['validated_ds'] == validated_ds:
+            return
         
-        self.app.log_message("Table Phase 1 affichée", "INFO")
+        input_data['validated_ds'] = validated_ds
+        self.tree.set(iid, "val", validated_ds or "En attente")
+        self.tree.set(iid, "action", copy_text if validated_ds else "")
+        self._set_row_tag(iid, "validated", bool(validated_ds))
+    
+    def _set_row_tag(self, iid, tag, enabled):
+        """Add or remove one tag of a row, keeping its other tags"""
+        tags = [t for t in self.tree.item(iid, "tags") if t != tag]
+        if enabled:
+            tags.append(tag)
+        self.tree.item(iid, tags=tags)
+    
+    def _set_row_invalid(self, iid, invalid):
+        """Highlight (or clear) a row whose signed series failed validation"""
+        if invalid == (iid in self._invalid_iids):
+            return
+        self._invalid_iids ^= {iid}
+        self._set_row_tag(iid, "invalid", invalid)
+    
+    def _on_tree_click(self, event):
+        """Toggle selection on the checkbox column, copy on the action column"""
+        self._commit_signed_editor()
+        if self.tree.identify_region(event.x, event.y) != "cell":
+            return None
+        
+        iid = self.tree.identify_row(event.y)
+        column = self.tree.identify_column(event.x)
+        
+        if column == "#1" and not self.tree.parent(iid):
+            self._toggle_selection(int(iid[3:]))
+            return "break"
+        
+        input_data = self._inputs_by_iid.get(iid)
+        if column == "#5" and input_data and input_data['validated_ds']:
+            self._copy_ds(input_data)
+        return None
+    
+    def _on_tree_space(self, event):
+        """Toggle the selected LTA rows with the space bar"""
+        for iid in self.tree.selection():
+            if not self.tree.parent(iid):
+                self._toggle_selection(int(iid[3:]))
+        return "break"
+    
+    def _on_tree_double_click(self, event):
+        """Open the signed series editor on a double click in its column"""
+        if self.tree.identify_column(event.x) != "#6":
+            return None
+        self._open_signed_editor(self.tree.identify_row(event.y))
+        return "break"
+    
+    def _on_tree_return(self, event):
+        """Open the signed series editor for the focused row"""
+        self._open_signed_editor(self.tree.focus())
+        return "break"
+    
+    def _open_signed_editor(self, iid):
+        """Overlay a transient Entry on the 'Série Signée' cell of a row"""
+        input_data = self._inputs_by_iid.get(iid)
+        if not input_data:
+            return
+        
+        self.tree.see(iid)
+        self.tree.update_idletasks()
+        bbox = self.tree.bbox(iid, "signed")
+        if not bbox:
+            return
+        
+        self._commit_signed_editor()
+        x, y, width, height = bbox
+        entry = ttk.Entry(self.tree)
+        entry.insert(0, input_data['signed_series'])
+        entry.select_range(0, tk.END)
+        entry.place(x=x, y=y, width=width, height=height)
+        entry.focus_set()
+        
+        entry.bind("<Return>", self._commit_signed_editor)
+        entry.bind("<FocusOut>", self._commit_signed_editor)
+        entry.bind("<Escape>", self._cancel_signed_editor)
+        self._signed_editor = (entry, iid)
+    
+    def _commit_signed_editor(self, event=None):
+        """Store the editor text for its row and close the editor"""
+        if not self._signed_editor:
+            return
+        entry, iid = self._signed_editor
+        value = entry.get().strip()
+        self._inputs_by_iid[iid]['signed_series'] = value
+        self.tree.set(iid, "signed", value)
+        self._set_row_invalid(iid, False)
+        self._cancel_signed_editor()
+    
+    def _cancel_signed_editor(self, event=None):
+        """Close the editor without keeping its text"""
+        if not self._signed_editor:
+            return
+        entry, _ = self._signed_editor
+        self._signed_editor = None
+        entry.destroy()
+        self.tree.focus_set()
+    
+    def _copy_ds(self, input_data):
+        """Copy a validated DS to the clipboard"""
+        text = input_data['validated_ds']
+        self.frame.clipboard_clear()
+        self.frame.clipboard_append(text)
+        self.app.log_message(f"DS copié: {text} ({self._row_label(input_data)})", "SUCCESS")
+    
+    @staticmethod
+    def _row_label(input_data):
+        """LTA name of a row, with its partial number for partial rows"""
+        lta_name = input_data['lta']['name']
+        if input_data.get('is_partial', False):
+            lta_name = f"{lta_name} Partiel {input_data['partial_number']}"
+        return lta_name
     
     def start_phase1(self):
         """Start Phase 1 automation"""
@@ -496,7 +613,7 @@ class Phase1EDScreen:
             selected_lta_names = None  # None means all
             selected_count = len(self.ltas_with_ds)
         else:
-            selected_indices = [i for i, var in enumerate(self.lta_checkboxes) if var.get()]
+            selected_indices = sorted(self._selected)
             
             if not selected_indices:
                 messagebox.showwarning(
@@ -524,12 +641,20 @@ class Phase1EDScreen:
         self.app.log_message(f"Démarrage de la Phase 1 pour {selected_count} LTA(s)...", "INFO")
         
         def on_progress(percent, message):
-            self.progress_var.set(percent)
-            self.status_var.set(message)
-            self.app.set_status(message)
-            self.app.log_message(message, "INFO")
+            # Called from the script thread: keep the latest value for the
+            # progress bar and every message for the logs, paint them later
+            self._pending_progress = (percent, message)
+            self._pending_logs.append(message)
+            if not self._progress_flush_scheduled:
+                self._progress_flush_scheduled = True
+                self.frame.after(_PROGRESS_FLUSH_MS, self._flush_progress)
         
         def on_complete(success=True, error=None):
+            # Finish on the Tk thread, after the last progress update
+            self.frame.after(0, finish, success, error)
+        
+        def finish(success, error):
+            self._flush_progress()
             self.start_btn.config(state="normal")
             
             if success:
@@ -540,8 +665,8 @@ class Phase1EDScreen:
                     "Entrez maintenant les séries signées dans la colonne 'Série Signée'.",
                     parent=self.frame
                 )
-                # Refresh table to show validated DS
-                self.refresh_lta_list()
+                # Show the validated DS without rebuilding the table
+                self._apply_validated_ds()
             else:
                 self.status_var.set(f"❌ Erreur: {error[:50] if error else 'Unknown'}")
                 self.app.log_message(f"Erreur Phase 1: {error}", "ERROR")
@@ -557,68 +682,111 @@ class Phase1EDScreen:
             selected_lta_names=selected_lta_names  # Pass folder names for filtering
         )
     
+    def _flush_progress(self):
+        """Paint the latest Phase 1 progress and log the messages received since"""
+        self._progress_flush_scheduled = False
+        pending, self._pending_progress = self._pending_progress, None
+        messages, self._pending_logs = self._pending_logs, []
+        
+        for message in messages:
+            self.app.log_message(message, "INFO")
+        
+        if pending:
+            percent, message = pending
+            self.progress_var.set(percent)
+            self.status_var.set(message)
+            self.app.set_status(message)
+    
     def save_signed_series(self):
         """Save signed series to LTA files"""
-        from gui.utils.file_utils import update_partial_signed_series
-        
         logger.info("Saving signed series...")
         self.app.log_message("Sauvegarde des séries signées...", "INFO")
         
-        saved_count = 0
-        error_count = 0
+        errors = []
+        jobs = []
+        
+        self._commit_signed_editor()
+        for iid in list(self._invalid_iids):
+            self._set_row_invalid(iid, False)
+        
+        # Rows with a series entered, normalized and validated in one pass
+        entered = [(iid, input_data) for iid, input_data in self._inputs_by_iid.items()
+                   if input_data['signed_series'].strip()]
+        checked = normalize_and_validate_batch(
+            [input_data['signed_series'] for _, input_data in entered]
+        )
         
-        for input_data in self.lta_inputs:
+        for (iid, input_data), (signed_series, is_valid, error_msg) in zip(entered, checked):
             lta = input_data['lta']
-            signed_series = input_data['signed_var'].get().strip()
             is_partial = input_data.get('is_partial', False)
             
-            if not signed_series:
-                continue
-            
             # Normalize format
-            signed_series = normalize_ds_series(signed_series)
-            input_data['signed_var'].set(signed_series)
+            input_data['signed_series'] = signed_series
+            self.tree.set(iid, "signed", signed_series)
             
-            # Validate
-            is_valid, error_msg = validate_signed_series(signed_series)
+            # Validate: collect the errors, they are shown together below
             if not is_valid:
-                messagebox.showerror(
-                    "Erreur de Validation",
-                    f"{lta['name']}: {error_msg}"
-                )
-                error_count += 1
+                errors.append((self._row_label(input_data), error_msg))
+                self._set_row_invalid(iid, True)
                 continue
             
-            # Save based on LTA type
-            if is_partial:
-                # Save to partial config JSON
-                partial_number = input_data['partial_number']
-                success = update_partial_signed_series(
-                    self.app.current_folder,
-                    lta['name'],
-                    partial_number,
-                    signed_series
-                )
-                if success:
-                    saved_count += 1
-                    self.app.log_message(
-                        f"✓ Série signée sauvegardée: {lta['name']} Partiel {partial_number} → {signed_series}",
-                        "SUCCESS"
-                    )
-                else:
-                    error_count += 1
-            else:
-                # Save to regular LTA file (line 8)
-                if lta['lta_file']:
-                    success = write_lta_signed_series(lta['lta_file'], signed_series)
-                    if success:
-                        saved_count += 1
-                        self.app.log_message(
-                            f"✓ Série signée sauvegardée: {lta['name']} → {signed_series}",
-                            "SUCCESS"
-                        )
-                    else:
-                        error_count += 1
+            # Regular LTAs without LTA file are skipped
+            if is_partial or lta['lta_file']:
+                jobs.append((input_data, signed_series))
+        
+        if errors:
+            messagebox.showerror(
+                "Erreurs de Validation",
+                "\n".join(f"{name}: {error_msg}" for name, error_msg in errors)
+            )
+        error_count = len(errors)
+        
+        # Write the files in the background, then report on the Tk thread
+        folder = self.app.current_folder
+        self.save_btn.config(state="disabled")
+        
+        def write_all():
+            # Sequential on purpose: partials of one LTA share the same JSON file
+            return [self._write_signed_series(folder, input_data, signed_series)
+                    for input_data, signed_series in jobs]
+        
+        def on_written(results):
+            self._on_signed_series_saved(jobs, results or [False] * len(jobs), error_count)
+        
+        self._run_in_background(write_all, on_written)
+    
+    @staticmethod
+    def _write_signed_series(folder, input_data, signed_series):
+        """Write one signed series to its partial config or LTA file (worker thread)"""
+        lta = input_data['lta']
+        if input_data.get('is_partial', False):
+            # Save to partial config JSON
+            return update_partial_signed_series(
+                folder,
+                lta['name'],
+                input_data['partial_number'],
+                signed_series
+            )
+        # Save to regular LTA file (line 8)
+        return write_lta_signed_series(lta['lta_file'], signed_series)
+    
+    def _on_signed_series_saved(self, jobs, results, error_count):
+        """Log the written series and show the save summary"""
+        self.save_btn.config(state="normal")
+        saved_count = 0
+        
+        for (input_data, signed_series), success in zip(jobs, results):
+            if not success:
+                error_count += 1
+                continue
+            saved_count += 1
+            self.app.log_message(
+                f"✓ Série signée sauvegardée: {self._row_label(input_data)} → {signed_series}",
+                "SUCCESS"
+            )
+        
+        # Files were rewritten: next refresh must re-read them
+        self._ltas_cache = None
         
         # Results
         if error_count == 0:
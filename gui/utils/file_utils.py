@@ -29,12 +29,13 @@ def clean_lta_reference(reference):
     
     return reference
 
-def detect_ltas(folder_path):
+def detect_ltas(folder_path, filter_has_ds=False):
     """
     Detect all LTA folders in the given path
     
     Args:
         folder_path: Path to search for LTA folders
+        filter_has_ds: Only return LTAs with DS series (their LTA file is not read otherwise)
         
     Returns:
         List of dicts with LTA information
@@ -106,6 +107,9 @@ def detect_ltas(folder_path):
             else:
                 lta_info['is_partial'] = False
             
+            if filter_has_ds and not lta_info['has_ds']:
+                continue
+            
             # Read LTA file if exists to get signed series and reference
             if lta_info['lta_file'] and os.path.exists(lta_info['lta_file']):
                 try:
@@ -129,6 +133,42 @@ def detect_ltas(folder_path):
         logger.error(f"Error detecting LTAs: {e}", exc_info=True)
         return []
 
+def lta_folder_signature(folder_path):
+    """
+    Cheap fingerprint of the files detect_ltas() reads
+    
+    Stats the top-level entries of the folder and each LTA subfolder's
+    partial config, without opening any file.
+    
+    Args:
+        folder_path: Path searched by detect_ltas()
+        
+    Returns:
+        Tuple that changes whenever one of those files changes, or None on error
+    """
+    signature = []
+    
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if 'lta' not in entry.name.lower():
+                        continue
+                    config_file = os.path.join(entry.path, f"{entry.name}_partial_config.json")
+                    try:
+                        st = os.stat(config_file)
+                        signature.append((entry.name, st.st_mtime_ns, st.st_size))
+                    except OSError:
+                        signature.append((entry.name, None, None))
+                else:
+                    st = entry.stat()
+                    signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError as e:
+        logger.error(f"Error reading folder {folder_path}: {e}")
+        return None
+    
+    return tuple(sorted(signature, key=lambda item: item[0]))
+
 def read_shipper_file(file_path):
     """
     Read shipper file (*_LTA_shipper_name.txt)
@@ -8,6 +8,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# DS series patterns, compiled once
+_DS_PARTS_RE = re.compile(r'^(\d{4})([A-Z]?)$')
+_FOUR_DIGITS_RE = re.compile(r'\d{4}')
+_LETTER_RE = re.compile(r'[A-Z]')
+_DS_SERIES_RE = re.compile(r'^\d{4}\s+[A-Z]$')
+_DS_SERIES_ERROR = "Format invalide. Attendu: '9913 G' (4 chiffres + espace + lettre)"
+
 def normalize_ds_series(text):
     """
     Normalize DS series format by removing extra whitespace and newlines
@@ -27,7 +34,7 @@ def normalize_ds_series(text):
     
     # Extract digits and letter
     # Pattern: extract 4 digits followed by a letter
-    match = re.match(r'^(\d{4})([A-Z]?)$', cleaned.upper())
+    match = _DS_PARTS_RE.match(cleaned.upper())
     
     if match:
         digits = match.group(1)
@@ -40,9 +47,9 @@ def normalize_ds_series(text):
     
     # If pattern doesn't match exactly, try to extract what we can
     # Find 4 consecutive digits
-    digits_match = re.search(r'\d{4}', cleaned)
+    digits_match = _FOUR_DIGITS_RE.search(cleaned)
     # Find a letter
-    letter_match = re.search(r'[A-Z]', cleaned.upper())
+    letter_match = _LETTER_RE.search(cleaned.upper())
     
     if digits_match and letter_match:
         return f"{digits_match.group()} {letter_match.group()}"
@@ -69,12 +76,10 @@ def validate_ds_series(text):
     text = normalize_ds_series(text)
     
     # Pattern: 4 digits + space + single uppercase letter
-    pattern = r'^\d{4}\s+[A-Z]$'
-    
-    if re.match(pattern, text):
+    if _DS_SERIES_RE.match(text):
         return True, None
     else:
-        return False, "Format invalide. Attendu: '9913 G' (4 chiffres + espace + lettre)"
+        return False, _DS_SERIES_ERROR
 
 def validate_location(text):
     """
@@ -111,6 +116,30 @@ def validate_signed_series(text):
     
     return validate_ds_series(text)
 
+def normalize_and_validate_batch(series_list):
+    """
+    Normalize and validate several signed series in one pass
+    
+    Same result as normalize_ds_series() followed by validate_signed_series()
+    on each item.
+    
+    Args:
+        series_list: List of input texts
+        
+    Returns:
+        List of tuples (normalized_text, is_valid, error_message)
+    """
+    results = []
+    for text in series_list:
+        normalized = normalize_ds_series(text)
+        if not normalized:
+            results.append((normalized, False, "La série signée est requise"))
+        elif _DS_SERIES_RE.match(normalized):
+            results.append((normalized, True, None))
+        else:
+            results.append((normalized, False, _DS_SERIES_ERROR))
+    return results
+
 def validate_folder_path(path):
     """
     Validate folder path exists